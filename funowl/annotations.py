@@ -115,8 +115,12 @@ class Annotatable(FunOwlBase, ABC):
                 annotation.TANN(g, subj)
 
     def add_triple(self, g: Graph, subj: SUBJ, pred: PRED, obj: TARG) -> None:
-        g.add((subj, pred, obj))
-        self.TANN(g, (subj, pred, obj))
+        # Runs once per axiom when serializing -- build the triple once and only take the TANN
+        # detour when there is actually something to reify
+        t = (subj, pred, obj)
+        g.add(t)
+        if self.annotations:
+            self.TANN(g, t)
 
 
 @dataclass
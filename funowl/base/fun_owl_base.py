@@ -16,6 +16,8 @@ from funowl.writers.FunctionalWriter import FunctionalWriter
 @dataclass(unsafe_hash=True)
 class FunOwlRoot:
     """ The root object for all OWL functional representations """
+    __slots__ = ()          # No state of its own -- lets subclasses opt into __slots__ for real
+
     def __post_init__(self):
         logging.debug(f"Constructed {repr(self)}")
 
@@ -81,4 +83,4 @@ class FunOwlBaseMeta(ABCMeta):
 
 @dataclass
 class FunOwlBase(FunOwlRoot, metaclass=FunOwlBaseMeta):
-    pass
+    __slots__ = ()
@@ -1,5 +1,6 @@
 import logging
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, ClassVar, get_type_hints, List, Type, Tuple, Optional
 
 from rdflib import Graph
@@ -25,22 +26,26 @@ class FunOwlChoice(FunOwlBase):
     input_type: ClassVar[Type] = None              # Type hint for IDE's.  Not actually included in coerrcion
 
     @classmethod
+    @lru_cache(maxsize=None)
     def types(cls) -> List[Type]:
         """
-        Return the allowed types for value v
+        Return the allowed types for value v.  The result is computed once per class -- resolving the
+        type hints walks the typing machinery and is far too expensive to repeat on every assignment.
         """
         return get_type_hints(cls)['v']
 
     @classmethod
-    def hints(cls) -> List[Type]:
+    @lru_cache(maxsize=None)
+    def hints(cls) -> Tuple[Type, ...]:
         """
-        Return the allowed types for value v, removing the input_type hint
+        Return the allowed types for value v, removing the input_type hint.  Cached (and therefore
+        returned as an immutable tuple) for the same reason as types()
         """
         hints = cls.types()
         t = list(get_args(hints)) if is_union(hints) else [hints]
         if cls.input_type:
             t.remove(cls.input_type)
-        return t
+        return tuple(t)
 
     def set_v(self, value: Any) -> bool:
         """ Default setter -- can be invoked from more elaborate coercion routines
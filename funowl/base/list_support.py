@@ -6,7 +6,11 @@ from funowl.base.cast_function import cast
 
 
 def empty_list():
-    """ Shortcut dataclass list factory initializer """
+    """ Shortcut dataclass list factory initializer.
+
+    Returns dataclasses.field(default_factory=list) -- evaluated once per class at definition time,
+    so each instance gets a fresh list through the generated __init__ with no extra per-instance call.
+    """
     return field(default_factory=list)
 
 
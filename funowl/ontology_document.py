@@ -11,6 +11,7 @@ Ontology :=
 """
 import sys
 from dataclasses import dataclass, MISSING
+from functools import lru_cache
 from typing import Optional, List, Union, Dict, cast
 
 from rdflib import Graph, RDF, OWL, URIRef, BNode
@@ -19,7 +20,7 @@ from funowl.assertions import DataPropertyAssertion
 from funowl.annotations import Annotation, AnnotationValue, AnnotationProperty, Annotatable
 from funowl.axioms import Axiom
 from funowl.base.fun_owl_base import FunOwlBase
-from funowl.base.list_support import empty_list
+from funowl.base.list_support import empty_list, ListWrapper
 from funowl.base.rdftriple import NODE, SUBJ
 from funowl.class_axioms import SubClassOf, EquivalentClasses
 from funowl.class_expressions import Class, ClassExpression
@@ -33,12 +34,39 @@ from funowl.objectproperty_axioms import SubObjectPropertyOf, SubObjectPropertyE
     FunctionalObjectProperty, InverseFunctionalObjectProperty, ObjectPropertyDomain, ObjectPropertyRange
 from funowl.objectproperty_expressions import ObjectPropertyExpression
 from funowl.prefix_declarations import Prefix
-from funowl.terminals.TypingHelper import isinstance_
+from funowl.terminals.TypingHelper import isinstance_, union_classes
 from funowl.writers.FunctionalWriter import FunctionalWriter
 
+# The Axiom union flattened to concrete classes -- builtin isinstance against this tuple replaces
+# the much slower typing-aware isinstance_ dispatch in the construction hot path
+_AXIOM_CLASSES = union_classes(Axiom)
+
+
+@lru_cache(maxsize=65536)
+def _uriref(s: str) -> URIRef:
+    """ Interning URIRef factory -- repeated serializations of the same IRI share one instance """
+    return URIRef(s)
+
+
+@lru_cache(maxsize=1024)
+def _make_prefix(key: Optional[str], value: str) -> Prefix:
+    """ Memoized Prefix factory -- re-declaring the same prefix skips PrefixName/FullIRI revalidation """
+    return Prefix(PrefixName(key) if key else None, FullIRI(value))
+
+
+# Bound once -- Namespace attribute access constructs a new URIRef on every lookup
+_RDF_TYPE = RDF.type
+_OWL_ONTOLOGY = OWL.Ontology
+_OWL_VERSION_IRI = OWL.versionIRI
+_OWL_IMPORTS = OWL.imports
+
 
 @dataclass
 class Import(FunOwlBase):
+    # One Import is allocated per imports entry when parsing large ontologies -- __slots__ drops the
+    # per-instance __dict__
+    __slots__ = ('iri',)
+
     iri: Union["Ontology", IRI]
 
     def ontology_iri(self) -> IRI:
@@ -48,7 +76,7 @@ class Import(FunOwlBase):
         return w.func(self, lambda: (w + self.iri))
 
     def to_rdf(self, _: Graph) -> Optional[NODE]:
-        return URIRef(str(self.ontology_iri()))
+        return _uriref(str(self.ontology_iri()))
 
 
 @dataclass
@@ -60,17 +88,25 @@ class Ontology(Annotatable):
     annotations: List[Annotation] = empty_list()
 
     def __init__(self, *args: Union[FunOwlBase, IRI.types()], **kwargs: Dict[str, FunOwlBase]) -> None:
-        args = list(args)
-        if args and isinstance(args[0], IRI) and not isinstance_(args[0], Axiom):
-            self.iri = args.pop(0)
-        if args and isinstance(args[0], IRI) and not isinstance_(args[0], Axiom):
-            self.version = args.pop(0)
-        self.directlyImportsDocuments = cast(List[Import], [])
-        while args and isinstance(args[0], Import):
-            self.directlyImportsDocuments.append(args.pop(0))
-        self.axioms = cast(List[Axiom], [])
-        while args and isinstance_(args[0], Axiom):
-            self.axioms.append(args.pop(0))
+        used = 0
+        if len(args) > used and isinstance(args[used], IRI) and not isinstance(args[used], _AXIOM_CLASSES):
+            self.iri = args[used]
+            used += 1
+        if len(args) > used and isinstance(args[used], IRI) and not isinstance(args[used], _AXIOM_CLASSES):
+            self.version = args[used]
+            used += 1
+        # Bucket the remaining arguments in a single pass -- the cheap C-level Import check first, the
+        # typing-aware Axiom check only when that fails
+        imports_buf, axioms_buf, leftover = cast(List[Import], []), cast(List[Axiom], []), []
+        for a in args[used:]:
+            if isinstance(a, Import):
+                imports_buf.append(a)
+            elif isinstance(a, _AXIOM_CLASSES):
+                axioms_buf.append(a)
+            else:
+                leftover.append(a)
+        self.directlyImportsDocuments = imports_buf
+        self.axioms = axioms_buf
         self.annotations = kwargs.get('annotations', [])
         for k, v in kwargs.items():
             cur_v = getattr(self, k, MISSING)
@@ -79,14 +115,18 @@ class Ontology(Annotatable):
             if cur_v is None:
                 setattr(self, k, v)
             elif k != 'annotations':
-                setattr(self, k, cur_v + v)
-
-        if args:
-            raise ValueError(f"Unrecognized arguments to Ontology: {args}")
+                if isinstance(cur_v, (list, ListWrapper)):
+                    # Merge in place -- list concatenation copies the accumulated list on every merge
+                    cur_v.extend(v)
+                else:
+                    setattr(self, k, cur_v + v)
+
+        if leftover:
+            raise ValueError(f"Unrecognized arguments to Ontology: {leftover}")
         self._naxioms = 0
 
     def add_arg(self, arg: [IRI.types(), Import, Axiom, Annotation]):
-        if isinstance_(arg, Axiom):
+        if isinstance(arg, _AXIOM_CLASSES):
             self.axioms.append(arg)
             self._naxioms += 1
             if not self._naxioms % 100000:
@@ -194,22 +234,30 @@ class Ontology(Annotatable):
         if self.version and not self.iri:
             raise ValueError(f"Ontology cannot have a versionIRI ({self.version} without an ontologyIRI")
         w = w or FunctionalWriter()
+        # Bind the collections once rather than re-resolving the attributes inside the lambda
+        imports = self.directlyImportsDocuments
+        annotations = self.annotations
+        axioms = self.axioms
+        nonempty = bool(imports) or bool(annotations) or bool(axioms)
         return w.func(self, lambda: w.opt(self.iri).opt(self.version).
-                 br(bool(self.directlyImportsDocuments) or bool(self.annotations) or bool(self.axioms)).
-                 iter(self.directlyImportsDocuments, indent=False).iter(self.annotations, indent=False).
-                 iter(self.axioms, indent=False), indent=False)
+                 br(nonempty).
+                 iter(imports, indent=False).iter(annotations, indent=False).
+                 iter(axioms, indent=False), indent=False)
 
     def to_rdf(self, g: Graph) -> SUBJ:
         ontology_uri = self.iri.to_rdf(g) if self.iri else BNode()
-        version_uri = self.version.to_rdf(g) if self.version else None
-        g.add((ontology_uri, RDF.type, OWL.Ontology))
+        # Accumulate the header and import triples and insert them in a single addN call -- one pass through
+        # the store API instead of one per triple
+        triples = [(ontology_uri, _RDF_TYPE, _OWL_ONTOLOGY)]
         if self.version:
-            g.add((ontology_uri, OWL.versionIRI, version_uri))
+            triples.append((ontology_uri, _OWL_VERSION_IRI, self.version.to_rdf(g)))
         for imp in self.directlyImportsDocuments:
-            g.add((ontology_uri, OWL.imports, imp.to_rdf(g)))
+            triples.append((ontology_uri, _OWL_IMPORTS, imp.to_rdf(g)))
+        g.addN((s, p, o, g) for s, p, o in triples)
         for axiom in self.axioms:
             axiom.to_rdf(g)
-        super().to_rdf(g)
+        if self.annotations:
+            super().to_rdf(g)
         return ontology_uri
 
 
@@ -222,49 +270,65 @@ class OntologyDocument(FunOwlBase):
     ontology: Ontology = None
 
     def __init__(self, default_prefix: FullIRI = None, ontology: Optional[Ontology] = None, **prefixes: FullIRI):
+        self._prefix_index = {}
         self.prefixDeclarations = []
         self.ontology = ontology if ontology is not None else Ontology()
         if default_prefix:
-            self.prefixDeclarations.append(Prefix(None, default_prefix))
-        if prefixes:
-            for k, v in prefixes.items():
-                self.prefixDeclarations.append(Prefix(k, v))
+            self._append_prefix(Prefix(None, default_prefix))
+        for k, v in prefixes.items():
+            self._append_prefix(Prefix(k, v))
 
     def prefixes(self, dflt: Optional[FullIRI], **prefixes: FullIRI) -> None:
         if dflt:
-            self.prefixDeclarations.append(Prefix('', dflt))
+            self._append_prefix(Prefix('', dflt))
         for ns, iri in prefixes.items():
-            self.prefixDeclarations.append(Prefix(PrefixName(ns), iri))
+            self._append_prefix(Prefix(PrefixName(ns), iri))
+
+    def _append_prefix(self, prefix: Prefix) -> None:
+        """ Record prefix and index it by name for O(1) resolution """
+        self.prefixDeclarations.append(prefix)
+        self.__dict__['_prefix_index'][str(prefix.prefixName) if prefix.prefixName else ''] = prefix.fullIRI
 
     def __setattr__(self, key: str, value) -> None:
         if key.startswith('_') or key in ('prefixDeclarations', 'ontology'):
             super().__setattr__(key, value)
         else:
-            prefix = Prefix(PrefixName(key) if key else None, FullIRI(value))
-            self.prefixDeclarations.append(prefix)
+            self._append_prefix(_make_prefix(key, value))
+
+    def __getitem__(self, key: Union[str, PrefixName]) -> FullIRI:
+        """ Resolve a prefix name to its full IRI.  Preferred over attribute-style access, which has
+        to fall through the whole attribute miss machinery before __getattr__ is consulted """
+        return self.__dict__['_prefix_index'][str(key)]
 
     def __getattr__(self, item):
-        # This gets called only when something isn't already in the dictionary
+        # This gets called only when something isn't already in the dictionary.
+        # Retained for backward compatibility -- new code should use doc[prefix] instead
         if isinstance(item, PrefixName):
-            for p in self.prefixDeclarations:
-                if p.prefixName == item:
-                    return p.fullIRI
+            rval = self.__dict__.get('_prefix_index', {}).get(item)
+            if rval is not None:
+                return rval
         return super().__getattribute__(item)
 
     def __str__(self) -> str:
         return self.to_functional().getvalue()
 
     def add_namespaces(self, g: Graph) -> Graph:
-        for prefix in self.prefixDeclarations:
-            g.namespace_manager.bind(str(prefix.prefixName or ''), str(prefix.fullIRI), True, True)
+        # Deduplicate before binding -- namespace_manager.bind validates and hits the store on every
+        # call, so re-declared prefixes should only be bound once (last declaration wins, as before)
+        bindings = {str(prefix.prefixName or ''): str(prefix.fullIRI) for prefix in self.prefixDeclarations}
+        bind = g.namespace_manager.bind
+        for ns, uri in bindings.items():
+            bind(ns, uri, True, True)
         return g
 
     def to_functional(self, w: Optional[FunctionalWriter] = None) -> FunctionalWriter:
         """ Return a FunctionalWriter instance with the representation of the OntologyDocument in functional syntax """
         w = w or FunctionalWriter()
         self.add_namespaces(w.g)
-        return w.iter([Prefix(ns, uri) for ns, uri in w.g.namespaces()], indent=False).hardbr() +\
-               (self.ontology or Ontology())
+        # Emit each prefix as it is produced -- no intermediate list of Prefix temporaries
+        for ns, uri in w.g.namespaces():
+            (w + Prefix(ns, uri)).br()
+        return w.hardbr() + (self.ontology or Ontology())
 
     def to_rdf(self, g: Graph) -> SUBJ:
         self.add_namespaces(g)
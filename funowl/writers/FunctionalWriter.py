@@ -58,10 +58,11 @@ class FunctionalWriter:
         :return: FunctionWriter instance
         """
         for el in eles:
-            if hasattr(el, 'to_functional') and callable(getattr(el, 'to_functional')):
+            to_func = getattr(el, 'to_functional', None)
+            if callable(to_func):
                 w = FunctionalWriter(g=self.g)
                 w._inside_function = self._inside_function
-                line = str(el.to_functional(w))
+                line = str(to_func(w))
             elif isinstance(el, FunctionalWriter):
                 raise ValueError("FunctionalWriter can never be concatenated to itself")
             else:
@@ -71,7 +72,9 @@ class FunctionalWriter:
 
     def bol(self) -> bool:
         """ Return True if at the beginning of a line and NOT the beginning of a "document" """
-        return not bool(self._line.strip())
+        # Called on every concat -- isspace avoids the string copy that strip() would allocate
+        line = self._line
+        return not line or line.isspace()
 
     def getvalue(self) -> str:
         """